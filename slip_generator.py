@@ -3,24 +3,86 @@
 Slip Generator - Automated +EV prop finder for OddsJam -> PrizePicks
 """
 
+import asyncio
+import hashlib
+import heapq
 import json
 import logging
 import os
 import re
-import time
-from dataclasses import dataclass
+import types
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from io import BytesIO
 from typing import List, Optional, Dict, Any
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import unquote
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-import schedule
 
 # Load environment variables
 load_dotenv()
 
-@dataclass
+# Use the C-based lxml parser when available (5-10x faster than the
+# pure-Python html.parser), falling back gracefully if it isn't installed
+try:
+    from lxml import etree
+    BS_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    BS_PARSER = 'html.parser'
+
+# Optional: selectolax's C-based lexbor engine is an order of magnitude
+# faster than BeautifulSoup for parsing + CSS selection on the hot
+# extract path; BeautifulSoup remains available via parser.engine config
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# orjson's Rust decoder is 2-6x faster than stdlib json on the config
+# and per-node data-attribute payloads; fall back to stdlib if missing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Precompiled patterns for the hot extract path - these run once per
+# link (and up to 5 parent levels deep) on every refresh cycle
+_RE_EV = re.compile(r'(\d+\.?\d*)%')
+_RE_NAME_CLASS = re.compile(r'player|name', re.I)
+_RE_STAT = re.compile(
+    r'\b(points?|rebounds?|assists?|steals?|blocks?'
+    r'|touchdowns?|yards?|receptions?|goals?|saves?)\b', re.I)
+_RE_SPORT = re.compile(r'\b(NBA|NFL|NHL|MLB|Soccer|Tennis|Golf)\b', re.I)
+_RE_PROJ = re.compile(r'[?&]projections=([^&]+)')
+_RE_PROJ_PARTS = re.compile(r'^([^-]+)-([ou])-(\d+(?:\.\d+)?)$')
+
+# Canonical casing for sport names matched case-insensitively above
+_SPORT_NAMES = {'NBA': 'NBA', 'NFL': 'NFL', 'NHL': 'NHL', 'MLB': 'MLB',
+                'SOCCER': 'Soccer', 'TENNIS': 'Tennis', 'GOLF': 'Golf'}
+
+@lru_cache(maxsize=1)
+def _creds() -> types.SimpleNamespace:
+    """Resolve credentials from the environment once per process.
+
+    login() runs every cycle under the scheduler, so keep the env
+    lookups out of the steady-state path.
+    """
+    return types.SimpleNamespace(
+        oddsjam_email=os.getenv('ODDSJAM_EMAIL'),
+        oddsjam_password=os.getenv('ODDSJAM_PASSWORD'),
+        telegram_token=os.getenv('TELEGRAM_BOT_TOKEN'),
+        telegram_chat_id=os.getenv('TELEGRAM_CHAT_ID'),
+    )
+
+@dataclass(slots=True, frozen=True)
 class Prop:
     """Represents a sports betting proposition"""
     prizepicks_id: str
@@ -30,19 +92,40 @@ class Prop:
     player_name: str
     stat_type: str
     sport: str
-    
+    # Derived projection string, built once at construction since the
+    # formatter runs per prop per cycle in link generation and hashing
+    _formatted: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # :g strips the trailing .0 from whole-number lines (24.0 -> 24)
+        object.__setattr__(self, '_formatted',
+                           f"{self.prizepicks_id}-{self.side}-{self.line:g}")
+
     def to_prizepicks_format(self) -> str:
         """Convert to PrizePicks URL format: id-side-line"""
-        return f"{self.prizepicks_id}-{self.side}-{self.line}"
+        return self._formatted
 
 class ConfigManager:
     """Manages configuration loading and validation"""
     
     def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        with open(config_path, 'rb') as f:
+            self.config = _json_loads(f.read())
         self._validate_config()
-    
+
+        # Flatten the nested config once so get('a.b.c') is a single
+        # dict lookup instead of a split + walk on every call
+        self._flat: Dict[str, Any] = {}
+        self._flatten(self.config, '')
+
+    def _flatten(self, node: Dict[str, Any], prefix: str):
+        """Index every dotted path, including intermediate sections"""
+        for key, value in node.items():
+            path = prefix + key
+            self._flat[path] = value
+            if isinstance(value, dict):
+                self._flatten(value, path + '.')
+
     def _validate_config(self):
         """Validate required configuration values"""
         required_keys = [
@@ -62,12 +145,9 @@ class ConfigManager:
     
     def get(self, key: str, default=None):
         """Get config value using dot notation"""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            value = value.get(k, default)
-            if value is None:
-                return default
+        value = self._flat.get(key)
+        if value is None:
+            return default
         return value
 
 class OddsJamExtractor:
@@ -75,24 +155,62 @@ class OddsJamExtractor:
     
     def __init__(self, config: ConfigManager):
         self.config = config
+        # Resolve hot-path config once instead of per cycle
+        self.dashboard_url = config.get('oddsjam.url')
+        self.parser_engine = config.get('parser.engine', 'selectolax')
         self.session = requests.Session()
         self._setup_session()
-    
+
+        # Conditional-GET state: when the dashboard hasn't changed we can
+        # skip the HTML parse entirely and reuse the last extracted props
+        self._last_etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._last_digest: Optional[bytes] = None
+        self._cached_props: List[Prop] = []
+
+        # Per-cycle memo of element text: parent chains overlap heavily
+        # across bet links, so serialize each subtree at most once
+        self._text_cache: Dict[Any, str] = {}
+
+        # Reusable tuned parser: drop comments and processing
+        # instructions at parse time so they never enter the tree, and
+        # skip the id-attribute index the extractor never queries
+        self._html_parser = etree.HTMLParser(
+            huge_tree=True,
+            remove_comments=True,
+            remove_pis=True,
+            collect_ids=False,
+        ) if etree is not None else None
+
     def _setup_session(self):
-        """Setup session with headers"""
+        """Setup session with headers and connection pooling"""
+        # One keep-alive connection shared by login, dashboard fetches
+        # and redirects, with retries on transient server errors
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=1.0,
+                status_forcelist=(500, 502, 503, 504)
+            )
+        ))
+        # 'br' lets Cloudflare serve brotli; requests decompresses
+        # transparently when the brotli package is installed
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
         })
     
     def login(self) -> bool:
         """Login to OddsJam if credentials are provided"""
-        email = os.getenv('ODDSJAM_EMAIL')
-        password = os.getenv('ODDSJAM_PASSWORD')
-        
+        creds = _creds()
+        email = creds.oddsjam_email
+        password = creds.oddsjam_password
+
         if not email or not password:
             logging.warning("No OddsJam credentials provided. Attempting to scrape without login.")
             return False
@@ -100,8 +218,8 @@ class OddsJamExtractor:
         try:
             # Get login page
             login_url = "https://app.oddsjam.com/login"
-            response = self.session.get(login_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.session.get(login_url, timeout=(5, 30))
+            soup = BeautifulSoup(response.content, BS_PARSER)
             
             # Find CSRF token or other required fields
             csrf_token = soup.find('meta', {'name': 'csrf-token'})
@@ -114,7 +232,7 @@ class OddsJamExtractor:
                 'password': password
             }
             
-            response = self.session.post(login_url, data=login_data)
+            response = self.session.post(login_url, data=login_data, timeout=(5, 30))
             
             # Check if login was successful
             if 'dashboard' in response.url or response.status_code == 200:
@@ -131,62 +249,140 @@ class OddsJamExtractor:
     def extract_props(self) -> List[Prop]:
         """Extract props from OddsJam dashboard"""
         try:
-            dashboard_url = self.config.get('oddsjam.url')
-            response = self.session.get(dashboard_url)
-            
+            dashboard_url = self.dashboard_url
+
+            # Ask the server to validate our cached copy
+            headers = {}
+            if self._last_etag:
+                headers['If-None-Match'] = self._last_etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+
+            response = self.session.get(dashboard_url, headers=headers or None, timeout=(5, 30))
+
+            if response.status_code == 304:
+                logging.info("Dashboard unchanged (304), reusing cached props")
+                return self._cached_props
+
             if response.status_code != 200:
                 logging.error(f"Failed to fetch OddsJam dashboard: {response.status_code}")
                 return []
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            props = []
-            
-            # Look for "Place Bet" links that contain PrizePicks URLs
-            bet_links = soup.find_all('a', href=re.compile(r'app\.prizepicks\.com'))
-            
-            for link in bet_links:
-                href = link.get('href')
-                prop = self._parse_prizepicks_link(href, link)
-                if prop:
-                    props.append(prop)
-            
-            # Alternative: Look for data attributes or structured data
-            if not props:
-                props = self._extract_from_data_attributes(soup)
-            
+
+            self._last_etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+
+            # Fallback when the server strips validators: compare a body hash
+            if not self._last_etag and not self._last_modified:
+                digest = hashlib.blake2b(response.content, digest_size=16).digest()
+                if digest == self._last_digest:
+                    logging.info("Dashboard content unchanged, reusing cached props")
+                    return self._cached_props
+                self._last_digest = digest
+
+            if self.parser_engine == 'selectolax' and LexborHTMLParser is not None:
+                props = self._extract_props_selectolax(response.content)
+            else:
+                props = self._extract_props_lxml(response.content)
+
+            self._cached_props = props
             logging.info(f"Extracted {len(props)} props from OddsJam")
             return props
-            
+
         except Exception as e:
             logging.error(f"Error extracting props from OddsJam: {e}")
             return []
+
+    def _extract_props_selectolax(self, content: bytes) -> List[Prop]:
+        """Extract props using the fast lexbor engine"""
+        tree = LexborHTMLParser(content.decode('utf-8', 'ignore'))
+
+        # Look for "Place Bet" links that contain PrizePicks URLs;
+        # the substring match runs natively in the selector engine
+        candidates = [(node.attributes.get('href'), node)
+                      for node in tree.css('a[href*="app.prizepicks.com"]')]
+        candidates = [(href, node) for href, node in candidates if href]
+
+        props = self._parse_links_parallel(candidates, self._parse_prizepicks_node)
+
+        # Alternative: Look for data attributes or structured data
+        if not props:
+            props = self._extract_from_data_attributes_lex(tree)
+
+        return props
+
+    def _extract_props_lxml(self, content: bytes) -> List[Prop]:
+        """Extract props using lxml etree (fallback engine).
+
+        Raw lxml skips BeautifulSoup's Python wrapper tree entirely:
+        the parse and the href substring match both run in C. Parsing
+        from BytesIO feeds lxml the response bytes directly, with no
+        intermediate str copy.
+        """
+        tree = etree.parse(BytesIO(content), self._html_parser)
+
+        # Look for "Place Bet" links that contain PrizePicks URLs
+        bet_links = tree.xpath('//a[contains(@href, "app.prizepicks.com")]')
+        candidates = [(elem.get('href'), elem) for elem in bet_links]
+
+        self._text_cache.clear()
+        props = self._parse_links_parallel(candidates, self._parse_prizepicks_link)
+
+        # Alternative: Look for data attributes or structured data
+        if not props:
+            props = self._extract_from_data_attributes(tree)
+
+        return props
+
+    def _parse_links_parallel(self, candidates, parse) -> List[Prop]:
+        """Parse candidate (href, element) pairs, fanning out to threads.
+
+        Each link costs several regex scans over up to five parent
+        levels and the links are independent, so overlap the work.
+        """
+        if len(candidates) <= 1:
+            results = [parse(href, elem) for href, elem in candidates]
+        else:
+            hrefs = [href for href, _ in candidates]
+            elems = [elem for _, elem in candidates]
+            with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as pool:
+                results = list(pool.map(parse, hrefs, elems))
+
+        return [prop for prop in results if prop]
     
+    def _parse_projection(self, href: str) -> Optional[tuple]:
+        """Extract (id, side, line) from a projections URL parameter.
+
+        A single precompiled regex pass replaces urlparse + parse_qs,
+        and the parts pattern validates the id-side-line shape strictly
+        (side must be o/u, line must be numeric).
+        """
+        match = _RE_PROJ.search(href)
+        if not match:
+            return None
+
+        parts = _RE_PROJ_PARTS.match(unquote(match.group(1)))
+        if not parts:
+            return None
+
+        return parts.groups()
+
     def _parse_prizepicks_link(self, href: str, element) -> Optional[Prop]:
         """Parse PrizePicks link to extract prop data"""
         try:
-            # Extract projections parameter from URL
-            parsed_url = urlparse(href)
-            query_params = parse_qs(parsed_url.query)
-            projections = query_params.get('projections', [])
-            
-            if not projections:
-                return None
-            
             # Parse projection format: id-side-line
-            projection = projections[0]
-            parts = projection.split('-')
-            
-            if len(parts) != 3:
+            projection = self._parse_projection(href)
+            if not projection:
                 return None
-            
-            prizepicks_id, side, line = parts
-            
+
+            prizepicks_id, side, line = projection
+
             # Extract additional data from surrounding elements
+            text = self._elem_text(element)
             ev_percent = self._extract_ev_from_element(element)
             player_name = self._extract_player_name(element)
-            stat_type = self._extract_stat_type(element)
-            sport = self._extract_sport(element)
-            
+            stat_type = self._extract_stat_type(text)
+            sport = self._extract_sport(text)
+
             return Prop(
                 prizepicks_id=prizepicks_id,
                 side=side,
@@ -201,6 +397,21 @@ class OddsJamExtractor:
             logging.error(f"Error parsing PrizePicks link {href}: {e}")
             return None
     
+    def _elem_text(self, element) -> str:
+        """Memoized subtree text for the current parse cycle.
+
+        Serializing a subtree is O(size) and the same parents are
+        visited for every link below them - cache per element so each
+        subtree's text is built at most once per page. Keying on the
+        element itself also keeps lxml's proxy objects alive, so
+        identity stays stable for the duration of the cycle.
+        """
+        text = self._text_cache.get(element)
+        if text is None:
+            text = ''.join(element.itertext())
+            self._text_cache[element] = text
+        return text
+
     def _extract_ev_from_element(self, element) -> float:
         """Extract EV percentage from element or nearby elements"""
         try:
@@ -209,21 +420,21 @@ class OddsJamExtractor:
             for _ in range(5):  # Check up to 5 parent levels
                 if current is None:
                     break
-                
+
                 # Look for percentage text
-                text = current.get_text()
-                ev_match = re.search(r'(\d+\.?\d*)%', text)
+                text = self._elem_text(current)
+                ev_match = _RE_EV.search(text)
                 if ev_match:
                     return float(ev_match.group(1))
-                
-                current = current.parent
-            
+
+                current = current.getparent()
+
             # Default to 0 if not found
             return 0.0
-            
+
         except:
             return 0.0
-    
+
     def _extract_player_name(self, element) -> str:
         """Extract player name from element"""
         try:
@@ -232,75 +443,161 @@ class OddsJamExtractor:
             for _ in range(3):
                 if current is None:
                     break
-                
-                # Look for elements that might contain player names
-                name_elem = current.find(class_=re.compile(r'player|name', re.I))
-                if name_elem:
-                    return name_elem.get_text().strip()
-                
+
+                # Look for elements whose class hints at a player name
+                for desc in current.iter():
+                    cls = desc.get('class')
+                    if cls and _RE_NAME_CLASS.search(cls):
+                        return ''.join(desc.itertext()).strip()
+
+                current = current.getparent()
+
+            return "Unknown Player"
+
+        except:
+            return "Unknown Player"
+
+    def _parse_prizepicks_node(self, href: str, node) -> Optional[Prop]:
+        """Parse PrizePicks link from a lexbor node"""
+        try:
+            # Parse projection format: id-side-line
+            projection = self._parse_projection(href)
+            if not projection:
+                return None
+
+            prizepicks_id, side, line = projection
+
+            # Extract additional data from surrounding nodes
+            text = node.text()
+            ev_percent = self._extract_ev_from_node(node)
+            player_name = self._extract_player_name_from_node(node)
+            stat_type = self._extract_stat_type(text)
+            sport = self._extract_sport(text)
+
+            return Prop(
+                prizepicks_id=prizepicks_id,
+                side=side,
+                line=float(line),
+                ev_percent=ev_percent,
+                player_name=player_name,
+                stat_type=stat_type,
+                sport=sport
+            )
+
+        except Exception as e:
+            logging.error(f"Error parsing PrizePicks link {href}: {e}")
+            return None
+
+    def _extract_ev_from_node(self, node) -> float:
+        """Extract EV percentage from a lexbor node or its ancestors"""
+        try:
+            # Look for EV percentage in the node or parent nodes
+            current = node
+            for _ in range(5):  # Check up to 5 parent levels
+                if current is None:
+                    break
+
+                # Look for percentage text
+                text = current.text()
+                ev_match = _RE_EV.search(text)
+                if ev_match:
+                    return float(ev_match.group(1))
+
                 current = current.parent
-            
+
+            # Default to 0 if not found
+            return 0.0
+
+        except:
+            return 0.0
+
+    def _extract_player_name_from_node(self, node) -> str:
+        """Extract player name from a lexbor node"""
+        try:
+            # Look for player name in various possible locations
+            current = node
+            for _ in range(3):
+                if current is None:
+                    break
+
+                # Look for nodes whose class hints at a player name
+                name_node = current.css_first('[class*="player" i], [class*="name" i]')
+                if name_node:
+                    return name_node.text().strip()
+
+                current = current.parent
+
             return "Unknown Player"
-            
+
         except:
             return "Unknown Player"
-    
-    def _extract_stat_type(self, element) -> str:
-        """Extract stat type from element"""
+
+    def _extract_stat_type(self, text: str) -> str:
+        """Extract stat type from element text"""
         try:
-            text = element.get_text()
-            # Common stat types
-            stat_patterns = [
-                r'points?', r'rebounds?', r'assists?', r'steals?', r'blocks?',
-                r'touchdowns?', r'yards?', r'receptions?', r'goals?', r'saves?'
-            ]
-            
-            for pattern in stat_patterns:
-                if re.search(pattern, text, re.I):
-                    return re.search(pattern, text, re.I).group()
-            
+            # Single alternation scan over the common stat types,
+            # lowercased so 'Points' and 'points' dedupe identically
+            match = _RE_STAT.search(text)
+            if match:
+                return match.group(1).lower()
+
             return "Unknown Stat"
-            
+
         except:
             return "Unknown Stat"
     
-    def _extract_sport(self, element) -> str:
-        """Extract sport from element"""
+    def _extract_sport(self, text: str) -> str:
+        """Extract sport from element text"""
         try:
-            text = element.get_text()
-            sports = ['NBA', 'NFL', 'NHL', 'MLB', 'Soccer', 'Tennis', 'Golf']
-            
-            for sport in sports:
-                if sport.lower() in text.lower():
-                    return sport
-            
+            match = _RE_SPORT.search(text)
+            if match:
+                return _SPORT_NAMES[match.group(1).upper()]
+
             return "Unknown Sport"
-            
+
         except:
             return "Unknown Sport"
     
-    def _extract_from_data_attributes(self, soup) -> List[Prop]:
+    def _extract_from_data_attributes(self, tree) -> List[Prop]:
         """Alternative extraction method using data attributes"""
         props = []
         try:
             # Look for elements with data attributes that might contain prop data
-            prop_elements = soup.find_all(attrs={'data-prop': True})
-            
-            for elem in prop_elements:
+            for elem in tree.xpath('//*[@data-prop]'):
                 # Parse data attributes
                 data_prop = elem.get('data-prop')
                 if data_prop:
                     # Assume JSON format in data attribute
-                    prop_data = json.loads(data_prop)
+                    prop_data = _json_loads(data_prop)
                     prop = self._create_prop_from_data(prop_data)
                     if prop:
                         props.append(prop)
             
         except Exception as e:
             logging.error(f"Error extracting from data attributes: {e}")
-        
+
         return props
-    
+
+    def _extract_from_data_attributes_lex(self, tree) -> List[Prop]:
+        """Alternative extraction method using data attributes (lexbor)"""
+        props = []
+        try:
+            # Look for nodes with data attributes that might contain prop data
+            for elem in tree.css('[data-prop]'):
+                # Parse data attributes
+                data_prop = elem.attributes.get('data-prop')
+                if data_prop:
+                    # Assume JSON format in data attribute
+                    prop_data = _json_loads(data_prop)
+                    prop = self._create_prop_from_data(prop_data)
+                    if prop:
+                        props.append(prop)
+
+        except Exception as e:
+            logging.error(f"Error extracting from data attributes: {e}")
+
+        return props
+
     def _create_prop_from_data(self, data: dict) -> Optional[Prop]:
         """Create Prop object from data dictionary"""
         try:
@@ -318,28 +615,29 @@ class OddsJamExtractor:
 
 class PropFilter:
     """Filters and selects props based on criteria"""
-    
+
     def __init__(self, config: ConfigManager):
         self.config = config
-    
+        # Resolve filter criteria once; frozenset gives O(1) membership
+        # checks in the filter pass
+        self.min_ev = float(config.get('filters.min_ev_percent', 5.0))
+        self.max_legs = int(config.get('filters.max_legs', 3))
+        self.allowed_sports = frozenset(config.get('filters.sports', []) or [])
+
     def filter_and_select(self, props: List[Prop]) -> List[Prop]:
         """Filter props and select top candidates"""
-        # Filter by minimum EV
-        min_ev = self.config.get('filters.min_ev_percent', 5.0)
-        filtered_props = [p for p in props if p.ev_percent >= min_ev]
-        
-        # Filter by sports if specified
-        allowed_sports = self.config.get('filters.sports', [])
-        if allowed_sports:
-            filtered_props = [p for p in filtered_props if p.sport in allowed_sports]
-        
-        # Sort by EV percentage (highest first)
-        filtered_props.sort(key=lambda x: x.ev_percent, reverse=True)
-        
-        # Select top N legs
-        max_legs = self.config.get('filters.max_legs', 3)
-        selected_props = filtered_props[:max_legs]
-        
+        min_ev = self.min_ev
+        max_legs = self.max_legs
+        allowed_sports = self.allowed_sports
+
+        # Single lazy pass: filter by EV and sport, keeping only the top
+        # max_legs by EV - O(N log K) instead of a full O(N log N) sort
+        candidates = (p for p in props
+                      if p.ev_percent >= min_ev
+                      and (not allowed_sports or p.sport in allowed_sports))
+        selected_props = heapq.nlargest(max_legs, candidates,
+                                        key=lambda p: p.ev_percent)
+
         logging.info(f"Filtered {len(props)} props to {len(selected_props)} top picks")
         return selected_props
 
@@ -348,13 +646,14 @@ class PrizePicksLinkGenerator:
     
     def __init__(self, config: ConfigManager):
         self.config = config
-    
+        self.base_url = config.get('prizepicks.base_url')
+
     def generate_link(self, props: List[Prop]) -> str:
         """Generate PrizePicks parlay link"""
         if not props:
             return ""
-        
-        base_url = self.config.get('prizepicks.base_url')
+
+        base_url = self.base_url
         projections = [prop.to_prizepicks_format() for prop in props]
         link = base_url + ",".join(projections)
         
@@ -366,51 +665,95 @@ class TelegramNotifier:
     
     def __init__(self, config: ConfigManager):
         self.config = config
-        self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN') or config.get('telegram.bot_token')
-        self.chat_id = os.getenv('TELEGRAM_CHAT_ID') or config.get('telegram.chat_id')
-    
-    def send_slip(self, props: List[Prop], link: str):
-        """Send slip notification to Telegram"""
-        if not self.config.get('telegram.enabled', True):
+        self.bot_token = _creds().telegram_token or config.get('telegram.bot_token')
+        self.chat_id = _creds().telegram_chat_id or config.get('telegram.chat_id')
+        self.enabled = bool(config.get('telegram.enabled', True))
+
+        # HTTP/2 client: one keep-alive TLS connection to
+        # api.telegram.org, multiplexed if multiple sends (per-prop
+        # notifications, multiple chat IDs) ever go out concurrently
+        self._client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            transport=httpx.HTTPTransport(retries=3),
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    def _build_payload(self, props: List[Prop], link: str) -> Dict[str, Any]:
+        """Build the sendMessage payload for a slip"""
+        # Calculate total EV
+        total_ev = sum(prop.ev_percent for prop in props)
+
+        # Build message
+        message = "🎯 **New +EV Slip Found!**\n\n"
+
+        for i, prop in enumerate(props, 1):
+            side_text = "Over" if prop.side == 'o' else "Under"
+            message += f"{i}. **{prop.player_name}** - {prop.stat_type}\n"
+            message += f"   {side_text} {prop.line} ({prop.ev_percent:+.1f}% EV)\n\n"
+
+        message += f"**Total EV:** {total_ev:+.1f}%\n"
+        message += f"**Legs:** {len(props)}\n\n"
+        message += f"[🔗 **Click to Bet on PrizePicks**]({link})"
+
+        return {
+            'chat_id': self.chat_id,
+            'text': message,
+            'parse_mode': 'Markdown',
+            'disable_web_page_preview': False
+        }
+
+    def _check_configured(self) -> bool:
+        """Verify notifications are enabled and credentials are set"""
+        if not self.enabled:
             logging.info("Telegram notifications disabled")
-            return
-        
+            return False
+
         if not self.bot_token or not self.chat_id:
             logging.error("Telegram bot token or chat ID not configured")
+            return False
+
+        return True
+
+    def send_slip(self, props: List[Prop], link: str):
+        """Send slip notification to Telegram"""
+        if not self._check_configured():
             return
-        
+
         try:
-            # Calculate total EV
-            total_ev = sum(prop.ev_percent for prop in props)
-            
-            # Build message
-            message = "🎯 **New +EV Slip Found!**\n\n"
-            
-            for i, prop in enumerate(props, 1):
-                side_text = "Over" if prop.side == 'o' else "Under"
-                message += f"{i}. **{prop.player_name}** - {prop.stat_type}\n"
-                message += f"   {side_text} {prop.line} ({prop.ev_percent:+.1f}% EV)\n\n"
-            
-            message += f"**Total EV:** {total_ev:+.1f}%\n"
-            message += f"**Legs:** {len(props)}\n\n"
-            message += f"[🔗 **Click to Bet on PrizePicks**]({link})"
-            
-            # Send message
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-            data = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'parse_mode': 'Markdown',
-                'disable_web_page_preview': False
-            }
-            
-            response = requests.post(url, data=data)
-            
+            response = self._client.post(url, data=self._build_payload(props, link))
+
             if response.status_code == 200:
                 logging.info("Successfully sent Telegram notification")
             else:
                 logging.error(f"Failed to send Telegram message: {response.status_code} - {response.text}")
-                
+
+        except Exception as e:
+            logging.error(f"Error sending Telegram notification: {e}")
+
+    async def async_send_slip(self, props: List[Prop], link: str):
+        """Async variant of send_slip for callers on the event loop"""
+        if not self._check_configured():
+            return
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(10.0, connect=3.0),
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            )
+
+        try:
+            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+            response = await self._async_client.post(url, data=self._build_payload(props, link))
+
+            if response.status_code == 200:
+                logging.info("Successfully sent Telegram notification")
+            else:
+                logging.error(f"Failed to send Telegram message: {response.status_code} - {response.text}")
+
         except Exception as e:
             logging.error(f"Error sending Telegram notification: {e}")
 
@@ -423,6 +766,9 @@ class SlipGenerator:
         self.filter = PropFilter(self.config)
         self.link_generator = PrizePicksLinkGenerator(self.config)
         self.notifier = TelegramNotifier(self.config)
+        # Digest of the last slip sent, so identical slips on
+        # consecutive cycles don't re-notify Telegram
+        self._last_hash: Optional[bytes] = None
         self._setup_logging()
     
     def _setup_logging(self):
@@ -461,7 +807,15 @@ class SlipGenerator:
             if not selected_props:
                 logging.info("No props met filtering criteria")
                 return
-            
+
+            # Skip notification if the slip is unchanged from last cycle
+            slip_key = ','.join(p.to_prizepicks_format() for p in selected_props)
+            slip_hash = hashlib.blake2b(slip_key.encode(), digest_size=16).digest()
+            if slip_hash == self._last_hash:
+                logging.info("Identical slip to last cycle, skipping notification")
+                return
+            self._last_hash = slip_hash
+
             # Generate PrizePicks link
             link = self.link_generator.generate_link(selected_props)
             
@@ -485,24 +839,27 @@ class SlipGenerator:
             return
         
         interval_minutes = self.config.get('schedule.refresh_interval_minutes', 1)
-        
-        # Schedule the job
-        schedule.every(interval_minutes).minutes.do(self.run_once)
-        
+
         logging.info(f"Scheduled to run every {interval_minutes} minutes")
         logging.info("Press Ctrl+C to stop")
-        
-        # Run once immediately
-        self.run_once()
-        
-        # Keep running
+
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
+            asyncio.run(self._run_loop(interval_minutes * 60))
         except KeyboardInterrupt:
             logging.info("Stopping slip generator")
 
+    async def _run_loop(self, interval_seconds: float):
+        """Async scheduler loop: run a cycle, then sleep until the next.
+
+        The pipeline itself is blocking (requests + HTML parsing), so it
+        runs in the default executor; the event loop stays free for
+        future concurrent work such as multi-source extraction.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await loop.run_in_executor(None, self.run_once)
+            await asyncio.sleep(interval_seconds)
+
 def main():
     """Main entry point"""
     try: